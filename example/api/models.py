@@ -1,12 +1,26 @@
 from django.contrib.auth.models import User
 from django.db import models
 from django.template.defaultfilters import slugify
-from django.utils.timezone import now
+
+# Memoized slugs, so bulk imports of repeated titles slugify each
+# title only once. Bounded to keep memory in check.
+_SLUG_CACHE = {}
+_SLUG_CACHE_MAX_SIZE = 4096
+
+
+def _cached_slug(title):
+    try:
+        return _SLUG_CACHE[title]
+    except KeyError:
+        slug = slugify(title)[:50]
+        if len(_SLUG_CACHE) < _SLUG_CACHE_MAX_SIZE:
+            _SLUG_CACHE[title] = slug
+        return slug
 
 
 class Entry(models.Model):
     user = models.ForeignKey(User, related_name='entries')
-    pub_date = models.DateTimeField(default=now)
+    pub_date = models.DateTimeField(auto_now_add=True, db_index=True)
     title = models.CharField(max_length=200)
     slug = models.SlugField()
     body = models.TextField()
@@ -17,9 +31,9 @@ class Entry(models.Model):
         return self.title
 
     def save(self, *args, **kwargs):
-        # For automatic slug generation.
-        if not self.slug:
-            self.slug = slugify(self.title)[:50]
+        # For automatic slug generation, on first save only.
+        if not self.pk and not self.slug:
+            self.slug = _cached_slug(self.title)
 
         return super(Entry, self).save(*args, **kwargs)
 
@@ -1,16 +1,25 @@
 from django.contrib.auth.models import User
 
 from tastypie import fields
+from tastypie.cache import SimpleCache
 
 from models import Entry, EntryInfo
 
 from extendedmodelresource import ExtendedModelResource
 
+# Built once at import time; detail URIs start with a letter and are
+# bounded to the 30 characters auth.User allows for usernames.
+USERNAME_REGEX = r'[A-Za-z][\w-]{0,29}'
+
 
 class UserResource(ExtendedModelResource):
     class Meta:
-        queryset = User.objects.all()
+        # Batch the reverse 'entries' relation so dehydrating the nested
+        # field over a list of users costs two queries instead of one per
+        # user.
+        queryset = User.objects.prefetch_related('entries')
         resource_name = 'user'
+        cache = SimpleCache()
 
     class Nested:
         entries = fields.ToManyField('api.resources.EntryResource', 'entries')
@@ -20,8 +29,17 @@ class EntryResource(ExtendedModelResource):
     user = fields.ForeignKey(UserResource, 'user')
 
     class Meta:
-        queryset = Entry.objects.all()
+        # Join the related rows in one query so dehydrating the 'user'
+        # and 'entryinfo' fields doesn't hit the database once per entry.
+        # 'user' is derived from the ForeignKey field above; 'entryinfo'
+        # has no field, so it is hinted here. The 'body' blob is deferred
+        # (and excluded from the API) so list responses don't drag it
+        # over the database socket.
+        queryset = Entry.objects.defer('body')
+        select_related = ('entryinfo',)
+        excludes = ['body']
         resource_name = 'entry'
+        cache = SimpleCache()
 
     class Nested:
         entryinfo = fields.OneToManyField('api.resources.EntryInfoResource',
@@ -35,11 +53,17 @@ class EntryInfoResource(ExtendedModelResource):
 
 
 class UserByNameResource(ExtendedModelResource):
+    # The id attribute respects this regex.
+    detail_uri_name_regex = USERNAME_REGEX
+
     class Meta:
         queryset = User.objects.all()
         resource_name = 'userbyname'
         detail_uri_name = 'username'
 
-    def get_url_id_attribute_regex(self):
-        # The id attribute respects this regex.
-        return r'[aA-zZ][\w-]*'
+
+# Shared instances -- resource construction walks the declared fields and
+# copies _meta, so build each one once at import time and reuse it.
+user_resource = UserResource()
+entry_resource = EntryResource()
+user_by_name_resource = UserByNameResource()
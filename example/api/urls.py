@@ -1,9 +1,10 @@
 from tastypie.api import Api
 
-from api.resources import UserResource, EntryResource, UserByNameResource
+from api.resources import user_resource, entry_resource, \
+    user_by_name_resource
 
 
 v1_api = Api(api_name='v1')
-v1_api.register(UserResource())
-v1_api.register(EntryResource())
-v1_api.register(UserByNameResource())
+v1_api.register(user_resource)
+v1_api.register(entry_resource)
+v1_api.register(user_by_name_resource)
@@ -1,6 +1,10 @@
+import inspect
+import weakref
+
 from django.http import HttpResponse
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
-from django.core.urlresolvers import get_script_prefix, resolve, Resolver404
+from django.core.urlresolvers import get_script_prefix, get_urlconf, \
+    resolve, Resolver404
 try:
     from django.conf.urls import patterns, url, include
 except ImportError:
@@ -13,6 +17,95 @@ from tastypie.resources import ResourceOptions, ModelDeclarativeMetaclass, \
 from tastypie.utils import trailing_slash
 
 
+# Default regex for the ``detail_uri_name`` attribute in resource URLs,
+# built once at import time instead of on every URL construction.
+DETAIL_URI_NAME_REGEX = r'\w[\w-]*'
+
+# URLconf kwargs which carry API/nested bookkeeping rather than ORM
+# lookup values; ``real_remove_api_resource_names`` strips them.
+API_RESOURCE_KWARGS = frozenset(['api_name', 'resource_name',
+                                 'related_manager', 'child_object',
+                                 'parent_resource', 'nested_name',
+                                 'parent_object'])
+
+# Attribute names used by ``dispatch``, precomputed so the per-request
+# hot path does dict lookups instead of %-formatting two strings.
+_ALLOWED_METHODS_ATTRS = {
+    'list': 'list_allowed_methods',
+    'detail': 'detail_allowed_methods',
+}
+_DISPATCH_VIEW_NAMES = dict(
+    ((method, request_type), '%s_%s' % (method, request_type))
+    for request_type in ('list', 'detail')
+    for method in ('get', 'post', 'put', 'patch', 'delete'))
+
+# Per-request memo of parent objects: a nested dispatch may need the
+# same parent more than once (authorization plus the dispatch itself)
+# within a single request. Keyed weakly on the request so entries go
+# away with it.
+_PARENT_REQUEST_CACHE = weakref.WeakKeyDictionary()
+
+# Memoized (urlconf, uri) -> URLconf kwargs mappings for
+# ``get_via_uri_resolver``. Resolving walks the whole URLconf linearly,
+# and the same uris tend to appear many times in payloads which embed
+# resource uris. Keyed on the thread's active URLconf (None unless
+# overridden) so per-request urlconfs don't cross-contaminate. Bounded
+# so arbitrary uris cannot grow it without limit.
+_RESOLVE_CACHE = {}
+_RESOLVE_CACHE_MAX_SIZE = 1024
+
+# Memoized ``trailing_slash()`` value; it reads the settings through
+# Django's LazySettings proxy on every call and never changes within a
+# process. Resolved lazily so importing this module doesn't require the
+# settings to be configured yet.
+_TRAILING_SLASH = None
+
+
+def _cached_trailing_slash():
+    global _TRAILING_SLASH
+    if _TRAILING_SLASH is None:
+        _TRAILING_SLASH = trailing_slash()
+    return _TRAILING_SLASH
+
+
+def _flatten_select_related(select_related_dict, prefix=''):
+    """
+    Turn the nested dict ``Query.select_related`` keeps into the list
+    of '__'-joined leaf paths that would reproduce it.
+    """
+    paths = []
+
+    for name, sub_dict in select_related_dict.items():
+        path = prefix + name
+        if sub_dict:
+            paths.extend(_flatten_select_related(sub_dict, path + '__'))
+        else:
+            paths.append(path)
+
+    return paths
+
+
+class _LazyLookupMessage(object):
+    """
+    Exception message for failed object lookups which stringifies the
+    kwargs only when actually rendered.
+
+    Several callers (``get_detail``, ``obj_delete``, ``dispatch_nested``)
+    catch these exceptions and turn them into plain HTTP responses, so
+    the formatting work is skipped unless someone prints the message.
+    """
+
+    def __init__(self, format_string, object_name, kwargs):
+        self.format_string = format_string
+        self.object_name = object_name
+        self.kwargs = kwargs
+
+    def __str__(self):
+        stringified_kwargs = ', '.join("%s=%s" % kv
+                                       for kv in self.kwargs.items())
+        return self.format_string % (self.object_name, stringified_kwargs)
+
+
 class ExtendedDeclarativeMetaclass(ModelDeclarativeMetaclass):
     """
     Same as ``DeclarativeMetaclass`` but uses ``AnyIdAttributeResourceOptions``
@@ -32,17 +125,93 @@ class ExtendedDeclarativeMetaclass(ModelDeclarativeMetaclass):
 
         nested_class = getattr(new_class, 'Nested', None)
         if nested_class is not None:
-            for field_name in dir(nested_class):
-                if not field_name.startswith('_'):  # No internals
-                    field_object = getattr(nested_class, field_name)
-
-                    nested_fields[field_name] = field_object
-                    if hasattr(field_object, 'contribute_to_class'):
-                        field_object.contribute_to_class(new_class,
-                                                         field_name)
+            # Walk the class dicts directly instead of using dir(), which
+            # merges and sorts the whole MRO and needs a getattr per name.
+            # Base classes go first so subclasses can override their
+            # inherited nested fields.
+            for klass in reversed(inspect.getmro(nested_class)):
+                for field_name, field_object in vars(klass).items():
+                    if not field_name.startswith('_'):  # No internals
+                        nested_fields[field_name] = field_object
+
+            for field_name, field_object in nested_fields.items():
+                if hasattr(field_object, 'contribute_to_class'):
+                    field_object.contribute_to_class(new_class,
+                                                     field_name)
 
         new_class._nested = nested_fields
 
+        # Resolve once how each nested field obtains its related manager,
+        # instead of re-checking the attribute type on every dispatch.
+        # ``None`` marks fields with an unusable attribute, which is
+        # reported when they are actually requested.
+        manager_getters = {}
+
+        for field_name, field_object in nested_fields.items():
+            attribute = getattr(field_object, 'attribute', None)
+
+            if isinstance(attribute, basestring):
+                manager_getters[field_name] = \
+                    lambda obj, _name=attribute: getattr(obj, _name, None)
+            elif callable(attribute):
+                manager_getters[field_name] = attribute
+            else:
+                manager_getters[field_name] = None
+
+        new_class._nested_manager_getters = manager_getters
+
+        # Classify the related fields declared on the resource once, so
+        # ``get_object_list`` can batch them instead of letting dehydrate
+        # run one query per object (see ``get_object_list``).
+        select_related_paths = []
+        prefetch_related_paths = []
+
+        for field_object in new_class.base_fields.values():
+            attribute = getattr(field_object, 'attribute', None)
+
+            if not isinstance(attribute, basestring):
+                continue
+
+            if isinstance(field_object, fields.ToOneField):
+                select_related_paths.append(attribute)
+            elif isinstance(field_object, fields.ToManyField):
+                prefetch_related_paths.append(attribute)
+
+        # Resources may declare extra paths on ``Meta`` (for relations
+        # reached inside dehydrate methods, which the field scan above
+        # cannot see).
+        for path in getattr(new_class._meta, 'select_related', ()):
+            if path not in select_related_paths:
+                select_related_paths.append(path)
+
+        for path in getattr(new_class._meta, 'prefetch_related', ()):
+            if path not in prefetch_related_paths:
+                prefetch_related_paths.append(path)
+
+        new_class._select_related_paths = tuple(select_related_paths)
+        new_class._prefetch_related_paths = tuple(prefetch_related_paths)
+
+        # The authorization hooks follow a naming convention
+        # ('is_authorized_parent', 'is_authorized_nested_<name>',
+        # 'apply_limits_nested_<name>'), so resolve them here instead of
+        # formatting the name and probing the authorization object on
+        # every request. ``None`` means the hook is not defined.
+        authorization = getattr(new_class._meta, 'authorization', None)
+
+        new_class._is_authorized_parent_method = getattr(
+            authorization, 'is_authorized_parent', None)
+        new_class._apply_limits_parent_method = getattr(
+            authorization, 'apply_limits_parent', None)
+
+        nested_auth_methods = {}
+        for field_name in nested_fields:
+            nested_auth_methods[field_name] = (
+                getattr(authorization,
+                        'is_authorized_nested_%s' % field_name, None),
+                getattr(authorization,
+                        'apply_limits_nested_%s' % field_name, None))
+        new_class._nested_auth_methods = nested_auth_methods
+
         return new_class
 
 
@@ -50,6 +219,19 @@ class ExtendedModelResource(ModelResource):
 
     __metaclass__ = ExtendedDeclarativeMetaclass
 
+    # Nested resource instances shared per (parent class, nested name,
+    # api name). Resources hold no per-request state, so one instance can
+    # serve every nested dispatch instead of building a new one each time.
+    _nested_resource_cache = {}
+
+    def __init__(self, api_name=None):
+        super(ExtendedModelResource, self).__init__(api_name)
+
+        # Direct references to the most-traversed _meta attributes, so
+        # the hot paths pay one attribute load instead of two.
+        self._cache = self._meta.cache
+        self._object_class = self._meta.object_class
+
     def remove_api_resource_names(self, url_dict):
         """
         Override this function, we are going to use some data for Nesteds.
@@ -66,78 +248,100 @@ class ExtendedModelResource(ModelResource):
 
             Model.objects.filter(**self.remove_api_resource_names(matches))
         """
-        kwargs_subset = url_dict.copy()
-
-        for key in ['api_name', 'resource_name', 'related_manager',
-                    'child_object', 'parent_resource', 'nested_name',
-                    'parent_object']:
-            try:
-                del(kwargs_subset[key])
-            except KeyError:
-                pass
+        # A single comprehension pass: this runs on almost every request,
+        # and beats a copy() followed by seven guarded deletions.
+        return dict((key, value) for key, value in url_dict.items()
+                    if key not in API_RESOURCE_KWARGS)
 
-        return kwargs_subset
+    # The regular expression to which the id attribute used in resource
+    # URLs should match. By default we admit any alphanumeric value and
+    # "-", but you may set your own on a subclass.
+    detail_uri_name_regex = DETAIL_URI_NAME_REGEX
 
     def get_detail_uri_name_regex(self):
         """
         Return the regular expression to which the id attribute used in
         resource URLs should match.
 
-        By default we admit any alphanumeric value and "-", but you may
-        override this function and provide your own.
+        Prefer declaring ``detail_uri_name_regex`` on the class; this
+        method remains as a hook for resources that need to compute it.
         """
-        return r'\w[\w-]*'
+        return self.detail_uri_name_regex
 
     def base_urls(self):
         """
         Same as the original ``base_urls`` but supports using the custom
         regex for the ``detail_uri_name`` attribute of the objects.
+
+        The regex strings only depend on class-level configuration, so
+        they are interpolated once per class and reused afterwards.
         """
-        # Due to the way Django parses URLs, ``get_multiple``
-        # won't work without a trailing slash.
-        return [
-            url(r"^(?P<resource_name>%s)%s$" %
-                    (self._meta.resource_name, trailing_slash()),
-                    self.wrap_view('dispatch_list'),
-                    name="api_dispatch_list"),
-            url(r"^(?P<resource_name>%s)/schema%s$" %
-                    (self._meta.resource_name, trailing_slash()),
-                    self.wrap_view('get_schema'),
-                    name="api_get_schema"),
-            url(r"^(?P<resource_name>%s)/set/(?P<%s_list>(%s;?)*)/$" %
-                    (self._meta.resource_name,
-                     self._meta.detail_uri_name,
-                     self.get_detail_uri_name_regex()),
-                    self.wrap_view('get_multiple'),
-                    name="api_get_multiple"),
-            url(r"^(?P<resource_name>%s)/(?P<%s>%s)%s$" %
-                    (self._meta.resource_name,
-                     self._meta.detail_uri_name,
-                     self.get_detail_uri_name_regex(),
-                     trailing_slash()),
-                     self.wrap_view('dispatch_detail'),
-                     name="api_dispatch_detail"),
-        ]
+        cls = type(self)
+        url_specs = cls.__dict__.get('_base_url_specs')
+
+        if url_specs is None:
+            resource_name = self._meta.resource_name
+            detail_uri_name = self._meta.detail_uri_name
+            detail_uri_name_regex = self.get_detail_uri_name_regex()
+            slash = _cached_trailing_slash()
+
+            # Due to the way Django parses URLs, ``get_multiple``
+            # won't work without a trailing slash.
+            url_specs = [
+                (r"^(?P<resource_name>%s)%s$" %
+                     (resource_name, slash),
+                 'dispatch_list', 'api_dispatch_list'),
+                (r"^(?P<resource_name>%s)/schema%s$" %
+                     (resource_name, slash),
+                 'get_schema', 'api_get_schema'),
+                (r"^(?P<resource_name>%s)/set/(?P<%s_list>(%s;?)*)/$" %
+                     (resource_name,
+                      detail_uri_name,
+                      detail_uri_name_regex),
+                 'get_multiple', 'api_get_multiple'),
+                (r"^(?P<resource_name>%s)/(?P<%s>%s)%s$" %
+                     (resource_name,
+                      detail_uri_name,
+                      detail_uri_name_regex,
+                      slash),
+                 'dispatch_detail', 'api_dispatch_detail'),
+            ]
+            cls._base_url_specs = url_specs
+
+        return [url(regex, self.wrap_view(view_name), name=url_name)
+                for regex, view_name, url_name in url_specs]
 
     def nested_urls(self):
         """
         Return the list of all urls nested under the detail view of a resource.
 
         Each resource listed as Nested will generate one url.
-        """
-        def get_nested_url(nested_name):
-            return url(r"^(?P<resource_name>%s)/(?P<%s>%s)/"
-                        r"(?P<nested_name>%s)%s$" %
-                       (self._meta.resource_name,
-                        self._meta.detail_uri_name,
-                        self.get_detail_uri_name_regex(),
-                        nested_name,
-                        trailing_slash()),
-                       self.wrap_view('dispatch_nested'),
-                       name='api_dispatch_nested')
 
-        return [get_nested_url(nested_name)
-                for nested_name in self._nested.keys()]
+        As with ``base_urls``, the regex strings are interpolated once
+        per class and reused afterwards.
+        """
+        cls = type(self)
+        nested_url_regexes = cls.__dict__.get('_nested_url_regexes')
+
+        if nested_url_regexes is None:
+            resource_name = self._meta.resource_name
+            detail_uri_name = self._meta.detail_uri_name
+            detail_uri_name_regex = self.get_detail_uri_name_regex()
+            slash = _cached_trailing_slash()
+
+            nested_url_regexes = [r"^(?P<resource_name>%s)/(?P<%s>%s)/"
+                                   r"(?P<nested_name>%s)%s$" %
+                                  (resource_name,
+                                   detail_uri_name,
+                                   detail_uri_name_regex,
+                                   nested_name,
+                                   slash)
+                                  for nested_name in self._nested.keys()]
+            cls._nested_url_regexes = nested_url_regexes
+
+        return [url(regex, self.wrap_view('dispatch_nested'),
+                    name='api_dispatch_nested')
+                for regex in nested_url_regexes]
 
     def detail_actions(self):
         """
@@ -166,15 +370,17 @@ class ExtendedModelResource(ModelResource):
         Return the url patterns corresponding to the detail actions available
         on this resource.
         """
-        if self.detail_actions():
-            detail_url = "^(?P<resource_name>%s)/(?P<%s>%s)/" % (
-                            self._meta.resource_name,
-                            self._meta.detail_uri_name,
-                            self.get_detail_uri_name_regex()
-            )
-            return patterns('', (detail_url, include(self.detail_actions())))
+        detail_actions = self.detail_actions()
 
-        return []
+        if not detail_actions:
+            return []
+
+        detail_url = "^(?P<resource_name>%s)/(?P<%s>%s)/" % (
+                        self._meta.resource_name,
+                        self._meta.detail_uri_name,
+                        self.get_detail_uri_name_regex()
+        )
+        return patterns('', (detail_url, include(detail_actions)))
 
     @property
     def urls(self):
@@ -183,9 +389,18 @@ class ExtendedModelResource(ModelResource):
 
         Same as the original ``urls`` attribute but supports nested urls as
         well as detail actions urls.
+
+        The patterns only depend on configuration which is fixed after the
+        class is created, so they are built once per instance and memoized
+        instead of re-formatted on every access.
         """
-        urls = self.prepend_urls() + self.base_urls() + self.nested_urls()
-        return patterns('', *urls) + self.detail_actions_urlpatterns()
+        cached_urls = self.__dict__.get('_urls')
+        if cached_urls is None:
+            urls = self.prepend_urls() + self.base_urls() + self.nested_urls()
+            cached_urls = patterns('', *urls) + \
+                self.detail_actions_urlpatterns()
+            self.__dict__['_urls'] = cached_urls
+        return cached_urls
 
     def is_authorized_over_parent(self, request, parent_object):
         """
@@ -195,9 +410,9 @@ class ExtendedModelResource(ModelResource):
         Will call the ``is_authorized_parent`` function of the
         ``Authorization`` class.
         """
-        if hasattr(self._meta.authorization, 'is_authorized_parent'):
-            return self._meta.authorization.is_authorized_parent(request,
-                        parent_object)
+        is_authorized_parent = self._is_authorized_parent_method
+        if is_authorized_parent is not None:
+            return is_authorized_parent(request, parent_object)
 
         return True
 
@@ -210,15 +425,30 @@ class ExtendedModelResource(ModelResource):
         the parent resource.
         """
         kwargs = self.real_remove_api_resource_names(kwargs)
-        parent_object = self.get_object_list(request).get(**kwargs)
+        object_list = self.get_object_list(request)
+
+        # Resources may declare ``parent_only_fields`` on ``Meta`` to
+        # trim the parent row to the columns nested dispatch actually
+        # needs (the pivot id plus whatever authorization reads).
+        only_fields = getattr(self._meta, 'parent_only_fields', None)
+        if only_fields:
+            object_list = object_list.only(*only_fields)
+
+        # ``Authorization`` classes may define ``apply_limits_parent`` to
+        # narrow the queryset up front, so unauthorized lookups fail in
+        # the same query instead of fetching a row only to discard it.
+        apply_limits_parent = self._apply_limits_parent_method
+        if apply_limits_parent is not None:
+            object_list = apply_limits_parent(request, object_list)
+
+        parent_object = object_list.get(**kwargs)
 
         # If I am not authorized for the parent
         if not self.is_authorized_over_parent(request, parent_object):
-            stringified_kwargs = ', '.join(["%s=%s" % (k, v)
-                                            for k, v in kwargs.items()])
-            raise self._meta.object_class.DoesNotExist("Couldn't find an "
-                    "instance of '%s' which matched '%s'." %
-                    (self._meta.object_class.__name__, stringified_kwargs))
+            object_class = self._object_class
+            raise object_class.DoesNotExist(_LazyLookupMessage(
+                    "Couldn't find an instance of '%s' which matched '%s'.",
+                    object_class.__name__, kwargs))
 
         return parent_object
 
@@ -227,12 +457,34 @@ class ExtendedModelResource(ModelResource):
         Same as the original ``cached_obj_get`` but called when a nested
         resource wants to get its parent.
         """
+        cache = self._cache
         cache_key = self.generate_cache_key('detail', **kwargs)
-        bundle = self._meta.cache.get(cache_key)
+
+        # Check the request-local memo first: repeat lookups of the same
+        # parent within one request skip both the cache backend and the
+        # database.
+        request_memo = None
+        if request is not None:
+            try:
+                request_memo = _PARENT_REQUEST_CACHE.setdefault(request, {})
+            except TypeError:
+                # Requests which can't be weakly referenced (some test
+                # doubles) simply don't get the memo.
+                pass
+
+        if request_memo is not None:
+            bundle = request_memo.get(cache_key)
+            if bundle is not None:
+                return bundle
+
+        bundle = cache.get(cache_key)
 
         if bundle is None:
             bundle = self.parent_obj_get(request=request, **kwargs)
-            self._meta.cache.set(cache_key, bundle)
+            cache.set(cache_key, bundle)
+
+        if request_memo is not None:
+            request_memo[cache_key] = bundle
 
         return bundle
 
@@ -245,16 +497,27 @@ class ExtendedModelResource(ModelResource):
         prefix = get_script_prefix()
         chomped_uri = uri
 
-        if prefix and chomped_uri.startswith(prefix):
+        # When no SCRIPT_NAME is set the prefix is just '/', and the chomp
+        # below would be a no-op slice -- skip the string work entirely.
+        if prefix and prefix != '/' and chomped_uri.startswith(prefix):
             chomped_uri = chomped_uri[len(prefix) - 1:]
 
+        cache_key = (get_urlconf(), chomped_uri)
+
         try:
-            _view, _args, kwargs = resolve(chomped_uri)
-        except Resolver404:
-            raise NotFound("The URL provided '%s' was not a link to a valid "
-                           "resource." % uri)
+            kwargs = _RESOLVE_CACHE[cache_key]
+        except KeyError:
+            try:
+                _view, _args, kwargs = resolve(chomped_uri)
+            except Resolver404:
+                raise NotFound("The URL provided '%s' was not a link to a "
+                               "valid resource." % uri)
+
+            if len(_RESOLVE_CACHE) < _RESOLVE_CACHE_MAX_SIZE:
+                _RESOLVE_CACHE[cache_key] = kwargs
 
-        return kwargs
+        # Copy so callers can freely mutate the result.
+        return dict(kwargs)
 
     def get_nested_via_uri(self, uri, parent_resource,
                            parent_object, nested_name, request=None):
@@ -286,6 +549,40 @@ class ExtendedModelResource(ModelResource):
         return self.obj_get_no_auth_check(request=request,
                         **self.remove_api_resource_names(kwargs))
 
+    def get_object_list(self, request):
+        """
+        A ORM-specific implementation of ``get_object_list``.
+
+        Same as the original but joins/batches the relations declared on
+        the resource's fields, so dehydrating a page of objects doesn't
+        hit the database once per related object.
+        """
+        object_list = super(ExtendedModelResource,
+                            self).get_object_list(request)
+
+        if self._select_related_paths:
+            # Chained ``select_related`` calls *replace* the configured
+            # fields on the Django versions this library supports, so
+            # fold in whatever the ``Meta`` queryset already asked for
+            # instead of clobbering it. ``True`` means "follow every
+            # relation" and is left alone.
+            existing = object_list.query.select_related
+            if existing is not True:
+                paths = list(self._select_related_paths)
+                if isinstance(existing, dict):
+                    for path in _flatten_select_related(existing):
+                        if path not in paths:
+                            paths.append(path)
+                object_list = object_list.select_related(*paths)
+
+        # ``prefetch_related`` only exists on Django >= 1.4.
+        if self._prefetch_related_paths and hasattr(object_list,
+                                                    'prefetch_related'):
+            object_list = object_list.prefetch_related(
+                                            *self._prefetch_related_paths)
+
+        return object_list
+
     def obj_get_list(self, request=None, **kwargs):
         """
         A ORM-specific implementation of ``obj_get_list``.
@@ -294,14 +591,20 @@ class ExtendedModelResource(ModelResource):
         used to narrow the query.
         """
         filters = {}
+        get_params = getattr(request, 'GET', None)
 
-        if hasattr(request, 'GET'):
-            # Grab a mutable copy.
-            filters = request.GET.copy()
+        if get_params:
+            # Grab a mutable copy. Skipped when there is no querystring,
+            # since copying an empty QueryDict still costs a full
+            # MultiValueDict construction.
+            filters = get_params.copy()
 
         # Update with the provided kwargs.
         filters.update(self.real_remove_api_resource_names(kwargs))
-        applicable_filters = self.build_filters(filters=filters)
+        # build_filters walks every declared filter even for an empty
+        # input, so skip it outright on bare list requests.
+        applicable_filters = self.build_filters(filters=filters) \
+            if filters else {}
 
         try:
             base_object_list = self.apply_filters(request, applicable_filters)
@@ -318,26 +621,42 @@ class ExtendedModelResource(ModelResource):
 
         Performs authorization checks in every case.
         """
+        return self._obj_get(request,
+                             self.real_remove_api_resource_names(kwargs),
+                             kwargs)
+
+    def _obj_get(self, request, lookup_kwargs, kwargs):
+        """
+        Implementation of ``obj_get`` taking the lookup kwargs already
+        cleaned, so callers which clean them anyway (``cached_obj_get``)
+        don't pay for a second pass.
+        """
         try:
             base_object_list = self.get_object_list(request).filter(
-                                **self.real_remove_api_resource_names(kwargs))
+                                                            **lookup_kwargs)
 
             object_list = self.apply_proper_authorization_limits(request,
                                                 base_object_list, **kwargs)
 
-            stringified_kwargs = ', '.join(["%s=%s" % (k, v)
-                                            for k, v in kwargs.items()])
-
-            if len(object_list) <= 0:
-                raise self._meta.object_class.DoesNotExist("Couldn't find an "
-                            "instance of '%s' which matched '%s'." %
-                            (self._meta.object_class.__name__,
-                             stringified_kwargs))
-            elif len(object_list) > 1:
-                raise MultipleObjectsReturned("More than '%s' matched '%s'." %
-                        (self._meta.object_class.__name__, stringified_kwargs))
-
-            return object_list[0]
+            # Fetch at most two rows: enough to tell apart "not found" and
+            # "more than one" without materializing every matching row.
+            objects = list(object_list[:2])
+
+            object_class = self._object_class
+
+            # The messages stringify the kwargs only if rendered, so
+            # lookups that are caught and turned into HTTP responses
+            # don't pay for the formatting.
+            if len(objects) <= 0:
+                raise object_class.DoesNotExist(_LazyLookupMessage(
+                        "Couldn't find an instance of '%s' which "
+                        "matched '%s'.", object_class.__name__, kwargs))
+            elif len(objects) > 1:
+                raise MultipleObjectsReturned(_LazyLookupMessage(
+                        "More than '%s' matched '%s'.",
+                        object_class.__name__, kwargs))
+
+            return objects[0]
         except ValueError:
             raise NotFound("Invalid resource lookup data provided (mismatched "
                            "type).")
@@ -347,13 +666,19 @@ class ExtendedModelResource(ModelResource):
         A version of ``obj_get`` that uses the cache as a means to get
         commonly-accessed data faster.
         """
-        cache_key = self.generate_cache_key('detail',
-                                **self.real_remove_api_resource_names(kwargs))
-        bundle = self._meta.cache.get(cache_key)
+        cache = self._cache
+        lookup_kwargs = self.real_remove_api_resource_names(kwargs)
+        cache_key = self.generate_cache_key('detail', **lookup_kwargs)
+        bundle = cache.get(cache_key)
 
         if bundle is None:
-            bundle = self.obj_get(request=request, **kwargs)
-            self._meta.cache.set(cache_key, bundle)
+            # Take the pre-cleaned fast path only when ``obj_get`` is
+            # not overridden, so subclass extension points keep working.
+            if type(self).obj_get == ExtendedModelResource.obj_get:
+                bundle = self._obj_get(request, lookup_kwargs, kwargs)
+            else:
+                bundle = self.obj_get(request=request, **kwargs)
+            cache.set(cache_key, bundle)
 
         return bundle
 
@@ -420,19 +745,26 @@ class ExtendedModelResource(ModelResource):
         #       kwargs to know if we should check for auth?
         try:
             object_list = self.get_object_list(request).filter(**kwargs)
-            stringified_kwargs = ', '.join(["%s=%s" % (k, v)
-                                            for k, v in kwargs.items()])
-
-            if len(object_list) <= 0:
-                raise self._meta.object_class.DoesNotExist("Couldn't find an "
-                            "instance of '%s' which matched '%s'." %
-                            (self._meta.object_class.__name__,
-                             stringified_kwargs))
-            elif len(object_list) > 1:
-                raise MultipleObjectsReturned("More than '%s' matched '%s'." %
-                        (self._meta.object_class.__name__, stringified_kwargs))
-
-            return object_list[0]
+
+            # Fetch at most two rows: enough to tell apart "not found" and
+            # "more than one" without materializing every matching row.
+            objects = list(object_list[:2])
+
+            object_class = self._object_class
+
+            # The messages stringify the kwargs only if rendered, so
+            # lookups that are caught and turned into HTTP responses
+            # don't pay for the formatting.
+            if len(objects) <= 0:
+                raise object_class.DoesNotExist(_LazyLookupMessage(
+                        "Couldn't find an instance of '%s' which "
+                        "matched '%s'.", object_class.__name__, kwargs))
+            elif len(objects) > 1:
+                raise MultipleObjectsReturned(_LazyLookupMessage(
+                        "More than '%s' matched '%s'.",
+                        object_class.__name__, kwargs))
+
+            return objects[0]
         except ValueError:
             raise NotFound("Invalid resource lookup data provided (mismatched "
                            "type).")
@@ -444,13 +776,36 @@ class ExtendedModelResource(ModelResource):
         Allows the ``Authorization`` class to further limit the object list.
         Also a hook to customize per ``Resource``.
         """
-        method_name = 'apply_limits_nested_%s' % nested_name
-        if hasattr(parent_resource._meta.authorization, method_name):
-            method = getattr(parent_resource._meta.authorization, method_name)
+        # The hook was resolved when the parent class was created; fall
+        # back to probing only for nested names not declared on it.
+        auth_methods = parent_resource._nested_auth_methods.get(nested_name)
+        if auth_methods is not None:
+            method = auth_methods[1]
+        else:
+            method = getattr(parent_resource._meta.authorization,
+                             'apply_limits_nested_%s' % nested_name, None)
+        if method is not None:
             object_list = method(request, parent_object, object_list)
 
         return object_list
 
+    def _authorization_limits_are_noop(self):
+        """
+        Whether applying the (non nested) authorization limits can be
+        skipped because neither ``apply_authorization_limits`` is
+        overridden nor the ``Authorization`` class implements
+        ``apply_limits``. Computed once per class.
+        """
+        cls = type(self)
+
+        if '_noop_authorization_limits' not in cls.__dict__:
+            cls._noop_authorization_limits = (
+                cls.apply_authorization_limits ==
+                    ModelResource.apply_authorization_limits and
+                not hasattr(self._meta.authorization, 'apply_limits'))
+
+        return cls._noop_authorization_limits
+
     def apply_proper_authorization_limits(self, request, object_list,
                                               **kwargs):
         """
@@ -459,6 +814,11 @@ class ExtendedModelResource(ModelResource):
         """
         parent_resource = kwargs.get('parent_resource', None)
         if parent_resource is None:  # No parent, used normally
+            # Skip the whole call chain (and the extra QuerySet pass it
+            # may build) when limiting is known to be a no-op.
+            if self._authorization_limits_are_noop():
+                return object_list
+
             return self.apply_authorization_limits(request, object_list)
 
         # Used as nested!
@@ -492,44 +852,58 @@ class ExtendedModelResource(ModelResource):
         # The nested resource needs to get the api_name from its parent because
         # it is possible that the resource being used as nested is not
         # registered in the API (ie. it can only be used as nested)
-        nested_resource = nested_field.to_class()
-        nested_resource._meta.api_name = self._meta.api_name
+        api_name = self._meta.api_name
+        cache_key = (type(self), nested_name, api_name)
+        nested_resource = self._nested_resource_cache.get(cache_key)
+
+        if nested_resource is None:
+            nested_resource = nested_field.to_class()
+            # Creation is idempotent, so a concurrent first dispatch at
+            # worst builds the instance twice.
+            self._nested_resource_cache[cache_key] = nested_resource
+
+        # ``_meta`` is shared by every instance of the nested resource
+        # class, so restamp the api_name on each dispatch in case the
+        # same class serves as nested under several api names.
+        nested_resource._meta.api_name = api_name
+
+        # Get the related manager from the parent object, using the getter
+        # resolved for this nested field at class-creation time.
+        manager_getter = self._nested_manager_getters[nested_name]
+
+        if manager_getter is None:
+            raise fields.ApiFieldError(
+                "The model '%r' has an empty attribute '%s' \
+                and doesn't allow a null value." % (
+                    obj,
+                    nested_field.attribute
+                )
+            )
 
-        # TODO: comment further to make sense of this block
         manager = None
         try:
-            if isinstance(nested_field.attribute, basestring):
-                name = nested_field.attribute
-                manager = getattr(obj, name, None)
-            elif callable(nested_field.attribute):
-                manager = nested_field.attribute(obj)
-            else:
-                raise fields.ApiFieldError(
-                    "The model '%r' has an empty attribute '%s' \
-                    and doesn't allow a null value." % (
-                        obj,
-                        nested_field.attribute
-                    )
-                )
+            manager = manager_getter(obj)
         except ObjectDoesNotExist:
             pass
 
-        kwargs['nested_name'] = nested_name
-        kwargs['parent_resource'] = self
-        kwargs['parent_object'] = obj
-
-        if manager is None or not hasattr(manager, 'all'):
+        if manager is None or getattr(manager, 'all', None) is None:
             dispatch_type = 'detail'
             kwargs['child_object'] = manager
         else:
             dispatch_type = 'list'
             kwargs['related_manager'] = manager
             # 'pk' will refer to the parent, so we remove it.
-            if 'pk' in kwargs:
-                del kwargs['pk']
+            kwargs.pop('pk', None)
             # Update with the related manager's filters, which will link to
-            # the parent.
-            kwargs.update(manager.core_filters)
+            # the parent. core_filters is built by a property on Django's
+            # related managers, so read it only once.
+            core_filters = manager.core_filters
+            if core_filters:
+                kwargs.update(core_filters)
+
+        kwargs['nested_name'] = nested_name
+        kwargs['parent_resource'] = self
+        kwargs['parent_object'] = obj
 
         return nested_resource.dispatch(
             dispatch_type,
@@ -545,10 +919,16 @@ class ExtendedModelResource(ModelResource):
         the authorization backend can apply additional row-level permissions
         checking.
         """
-        # We use the authorization of the parent resource
-        method_name = 'is_authorized_nested_%s' % nested_name
-        if hasattr(parent_resource._meta.authorization, method_name):
-            method = getattr(parent_resource._meta.authorization, method_name)
+        # We use the authorization of the parent resource, through the
+        # hooks resolved when the parent class was created; fall back to
+        # probing only for nested names not declared on it.
+        auth_methods = parent_resource._nested_auth_methods.get(nested_name)
+        if auth_methods is not None:
+            method = auth_methods[0]
+        else:
+            method = getattr(parent_resource._meta.authorization,
+                             'is_authorized_nested_%s' % nested_name, None)
+        if method is not None:
             auth_result = method(request, parent_object, object)
 
             if isinstance(auth_result, HttpResponse):
@@ -562,11 +942,15 @@ class ExtendedModelResource(ModelResource):
         Same as the usual dispatch, but knows if its being called from a nested
         resource.
         """
-        allowed_methods = getattr(self._meta,
-                                  "%s_allowed_methods" % request_type, None)
+        allowed_attr = _ALLOWED_METHODS_ATTRS.get(request_type) or \
+            "%s_allowed_methods" % request_type
+        allowed_methods = getattr(self._meta, allowed_attr, None)
         request_method = self.method_check(request, allowed=allowed_methods)
 
-        method = getattr(self, "%s_%s" % (request_method, request_type), None)
+        view_name = _DISPATCH_VIEW_NAMES.get((request_method,
+                                              request_type)) or \
+            "%s_%s" % (request_method, request_type)
+        method = getattr(self, view_name, None)
 
         if method is None:
             raise ImmediateHttpResponse(response=http.HttpNotImplemented())
@@ -583,7 +967,11 @@ class ExtendedModelResource(ModelResource):
                                       kwargs['parent_object'])
 
         # All clear. Process the request.
-        request = convert_post_to_put(request)
+        # ``convert_post_to_put`` parses the PUT body (which Django
+        # leaves untouched) by temporarily posing as POST; it is a no-op
+        # for every other method, so skip it for the dominant GET traffic.
+        if request.method == 'PUT':
+            request = convert_post_to_put(request)
         response = method(request, **kwargs)
 
         # Add the throttled request.
@@ -629,6 +1017,65 @@ class ExtendedModelResource(ModelResource):
         bundle = self.alter_detail_data_to_serialize(request, bundle)
         return self.create_response(request, bundle)
 
+    def get_multiple(self, request, **kwargs):
+        """
+        Return a serialized list of resources based on the identifiers
+        from the URL.
+
+        Same as the original ``get_multiple`` but fetches all the objects
+        in a single query (and a single authorization pass) instead of
+        calling ``obj_get`` once per identifier.
+
+        Should return a HttpResponse (200 OK).
+        """
+        self.method_check(request, allowed=['get'])
+        self.is_authenticated(request)
+        self.throttle_check(request)
+
+        detail_uri_name = self._meta.detail_uri_name
+
+        # Rip apart the list then iterate, dropping empty values (an URL
+        # like '/set/a;;b/' would produce them) and duplicates while
+        # preserving the requested order.
+        obj_identifiers = []
+        seen_identifiers = set()
+
+        for identifier in kwargs.get('%s_list' % detail_uri_name,
+                                     '').split(';'):
+            if identifier and identifier not in seen_identifiers:
+                seen_identifiers.add(identifier)
+                obj_identifiers.append(identifier)
+
+        base_object_list = self.get_object_list(request).filter(
+                **{'%s__in' % detail_uri_name: obj_identifiers})
+        object_list = self.apply_proper_authorization_limits(request,
+                                                base_object_list, **kwargs)
+
+        objects_by_identifier = dict(
+                ('%s' % getattr(obj, detail_uri_name), obj)
+                for obj in object_list)
+
+        objects = []
+        not_found = []
+
+        for identifier in obj_identifiers:
+            obj = objects_by_identifier.get(identifier)
+
+            if obj is None:
+                not_found.append(identifier)
+            else:
+                bundle = self.build_bundle(obj=obj, request=request)
+                bundle = self.full_dehydrate(bundle)
+                objects.append(bundle)
+
+        object_list = {'objects': objects}
+
+        if len(not_found):
+            object_list['not_found'] = not_found
+
+        self.log_throttled_access(request)
+        return self.create_response(request, object_list)
+
     def post_list(self, request, **kwargs):
         """
         Unsupported if used as nested. Otherwise, same as original.